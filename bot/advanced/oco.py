@@ -1,11 +1,12 @@
 """
 Improved OCO Orders: Auto-detect price and prevent trigger errors.
 """
+import asyncio
 
-from bot.utils.logging_config import configure_logs, get_logger
+from bot.utils.logging_config import get_logger
+from bot.utils.validators import Validator
 from ..client import BinanceBot
 
-configure_logs(verbose=True)
 logging = get_logger()
 
 class OCOOrder:
@@ -49,6 +50,23 @@ class OCOOrder:
         """
         Create a dual-order setup simulating an OCO structure in Binance Futures
         """
+        return asyncio.run(
+            self.place_oco_async(symbol, side, quantity, tp_percent, sl_percent)
+        )
+
+    async def place_oco_async(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        tp_percent: float = 2,
+        sl_percent: float = 2
+    ) -> dict | None:
+        """
+        Async variant of place_oco that submits the SL and TP orders
+        concurrently. The two orders are independent, so placing them in
+        parallel halves the window where the position sits unprotected.
+        """
         symbol = symbol.upper()
         side = side.upper()
 
@@ -56,54 +74,63 @@ class OCOOrder:
             logging.error("OCO Error: Only BUY or SELL allowed.")
             return None
 
-        current_price = self.get_price(symbol)
+        current_price = await asyncio.to_thread(self.get_price, symbol)
 
-        if side == "BUY":
-            tp = round(current_price * (1 + tp_percent / 100))
-            sl = round(current_price * (1 - sl_percent / 100))
+        # TP sits on the profit side and SL on the loss side of the entry;
+        # a sign multiplier collapses the BUY/SELL cases into one expression.
+        sign = 1.0 if side == "BUY" else -1.0
+        tp_frac = tp_percent / 100
+        sl_frac = sl_percent / 100
 
-            if sl >= current_price:
-                logging.error("SL must be BELOW current market price for BUY position")
-                raise ValueError("Stop Loss placement invalid for BUY order")
-            if tp <= current_price:
-                logging.error("TP must be ABOVE current market price for BUY position")
-                raise ValueError("Take Profit placement invalid for BUY order")
+        # Quantize to the exchange's tickSize so the stop prices always pass
+        # PRICE_FILTER; a whole-dollar round() gets rejected on fine-tick pairs.
+        filters = await asyncio.to_thread(Validator.symbol_filters, symbol, self.client)
+        price_filter = filters.get("PRICE_FILTER") if filters else None
+        tick_size = float(price_filter["tickSize"]) if price_filter else 0.0
 
-            order_side = "SELL"
+        if tick_size > 0:
+            tick_scale = round(1 / tick_size)
+            tp = round(current_price * (1 + sign * tp_frac) * tick_scale) / tick_scale
+            sl = round(current_price * (1 - sign * sl_frac) * tick_scale) / tick_scale
         else:
-            tp = round(current_price * (1 - tp_percent / 100))
-            sl = round(current_price * (1 + sl_percent / 100))
-
-            if sl <= current_price:
-                logging.error("SL must be ABOVE current market price for SELL position")
-                raise ValueError("Stop Loss placement invalid for SELL order")
-            if tp >= current_price:
-                logging.error("TP must be BELOW current market price for SELL position")
-                raise ValueError("Take Profit placement invalid for SELL order")
-            
-            order_side = "BUY"
+            tp = round(current_price * (1 + sign * tp_frac))
+            sl = round(current_price * (1 - sign * sl_frac))
+        order_side = "SELL" if side == "BUY" else "BUY"
+
+        if (tp - current_price) * sign <= 0 or (current_price - sl) * sign <= 0:
+            logging.error(
+                f"TP/SL placement invalid for {side} position: TP {tp} | SL {sl} | price {current_price}"
+            )
+            raise ValueError(f"TP/SL placement invalid for {side} order")
 
         logging.info(
             f"OCO Setup for {symbol} {side}: Qty {quantity} | TP: {tp} | SL: {sl}"
         )
 
+        # Both legs go over REST directly: the WS connection is bound to one
+        # event loop and is not safe from two concurrent worker threads, and
+        # conditional types land on the algo-order endpoint, which returns a
+        # different payload shape than futures_create_order.
         try:
-            sl_order = self.client.futures_create_order(
-                symbol=symbol,
-                side=order_side,
-                type="STOP_MARKET",
-                stopPrice=sl,
-                closePosition=False,
-                quantity=quantity
-            )
-
-            tp_order = self.client.futures_create_order(
-                symbol=symbol,
-                side=order_side,
-                type="TAKE_PROFIT_MARKET",
-                stopPrice=tp,
-                closePosition=False,
-                quantity=quantity
+            sl_order, tp_order = await asyncio.gather(
+                asyncio.to_thread(
+                    self.client.futures_create_order,
+                    symbol=symbol,
+                    side=order_side,
+                    type="STOP_MARKET",
+                    stopPrice=sl,
+                    closePosition=False,
+                    quantity=quantity
+                ),
+                asyncio.to_thread(
+                    self.client.futures_create_order,
+                    symbol=symbol,
+                    side=order_side,
+                    type="TAKE_PROFIT_MARKET",
+                    stopPrice=tp,
+                    closePosition=False,
+                    quantity=quantity
+                ),
             )
 
             logging.info("OCO Orders Active: TP and SL Placed Successfully")
@@ -1,14 +1,25 @@
 """
 Binance trading bot client is initialized here
 """
+import hashlib
+import hmac
 import os
+import threading
+import time
+import uuid
 from binance.client import Client
 from dotenv import load_dotenv
-from bot.utils.logging_config import configure_logs, get_logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from bot.utils.logging_config import get_logger
 from bot.utils.validators import Validator
 
 load_dotenv()
-configure_logs(verbose=True)
 logger = get_logger()
 
 class BinanceBot:
@@ -28,14 +39,139 @@ class BinanceBot:
 
         self.client = Client(api_key, secret_key, testnet=testnet)
         self._override_base_urls(testnet)
+        self._configure_session()
+        self._install_fast_signer(secret_key)
+        self._warm_validator_cache()
 
         logger.info("Binance client initialized successfully")
 
+    def _warm_validator_cache(self) -> None:
+        """
+        Seed the validators' exchange-info cache at startup so the first
+        order pays no precheck round-trip, then keep it warm in the
+        background
+        """
+        try:
+            Validator.warm_exchange_info(self.client)
+            logger.debug("Exchange-info cache warmed at startup")
+        except Exception as error:
+            logger.warning(f"Could not warm exchange-info cache: {error}")
+
+        threading.Thread(
+            target=self._cache_refresher, daemon=True, name="exchange-info-refresher"
+        ).start()
+
+    def _cache_refresher(self) -> None:
+        """Re-fetch exchange info each TTL window so trades never wait on it."""
+        while True:
+            time.sleep(300)
+            try:
+                Validator.warm_exchange_info(self.client)
+            except Exception as error:
+                logger.warning(f"Exchange-info cache refresh failed: {error}")
+
+    def _install_fast_signer(self, secret_key: str) -> None:
+        """
+        Replace the client's per-request HMAC setup with a prepared template.
+
+        hmac.new re-derives the key schedule on every signed call; copying a
+        pre-keyed template skips that so only the query-string digest runs on
+        the order hot path. Left untouched for RSA/Ed25519 keys or if the
+        client internals do not match.
+        """
+        order_params = getattr(self.client, "_order_params", None)
+        if getattr(self.client, "PRIVATE_KEY", None) or order_params is None:
+            return
+
+        template = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+        def _generate_signature(data: dict) -> str:
+            query_string = "&".join(f"{key}={value}" for key, value in order_params(data))
+            mac = template.copy()
+            mac.update(query_string.encode("utf-8"))
+            return mac.hexdigest()
+
+        self.client._generate_signature = _generate_signature
+        logger.debug("Prepared HMAC signing template installed")
+
+    def _configure_session(self) -> None:
+        """
+        Tune the underlying requests session so bursts of API calls reuse
+        keep-alive connections instead of paying a TLS handshake each time
+        """
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        self.client.session.mount("https://", adapter)
+        self.client.session.headers["Connection"] = "keep-alive"
+
+        if orjson is not None:
+            # Decode REST responses with orjson; exchange_info alone is a
+            # payload of over a megabyte and stdlib json is the largest CPU
+            # cost on that path after the network call itself.
+            def _orjson_hook(response, *args, **kwargs):
+                response.json = lambda **_: orjson.loads(response.content)
+                return response
+
+            self.client.session.hooks["response"].append(_orjson_hook)
+
+        logger.debug("HTTP session configured with keep-alive connection pool")
+
     def _override_base_urls(self, testnet:bool) -> None:
         if testnet:
             self.client.FUTURES_URL = "https://testnet.binancefuture.com/fapi"
             logger.debug(f"Base Url set to {self.client.FUTURES_URL}")
 
+    def create_order(self, **params) -> dict:
+        """
+        Submit a futures order, preferring the WebSocket API over REST.
+
+        python-binance exposes futures order entry over a persistent
+        authenticated socket (ws_futures_create_order) on recent versions;
+        that path skips the per-order HTTP round-trip. Falls back to the
+        REST endpoint when the method is unavailable or the socket fails.
+
+        Only for plain MARKET/LIMIT orders submitted from one thread: the
+        library's WS connection is bound to a single event loop, and it
+        routes conditional types (STOP_MARKET etc.) to the algo-order
+        endpoint, whose response shape differs from futures_create_order.
+        """
+        # One client order id covers both attempts: if the WS send reached
+        # the exchange before timing out or disconnecting, the REST retry is
+        # rejected as a duplicate instead of opening a second position.
+        params.setdefault("newClientOrderId", f"bot-{uuid.uuid4().hex}")
+
+        ws_create = getattr(self.client, "ws_futures_create_order", None)
+        if ws_create is not None:
+            try:
+                return ws_create(**params)
+            except Exception as error:
+                logger.warning(f"WebSocket order entry failed: {error}")
+                # A timeout or disconnect is raised only after the payload
+                # went out, so the exchange may already hold the order — and
+                # a filled MARKET order no longer blocks its client id from
+                # being reused. Look the order up before resubmitting.
+                placed = self._find_order(params["symbol"], params["newClientOrderId"])
+                if placed is not None:
+                    logger.info("WebSocket order was accepted despite the error; not resubmitting")
+                    return placed
+                logger.warning("Order not found on exchange, falling back to REST")
+        return self.client.futures_create_order(**params)
+
+    def _find_order(self, symbol: str, client_order_id: str) -> dict | None:
+        """
+        Return the order with this client order id if the exchange has it,
+        or None when it is unknown (or the lookup itself fails).
+        """
+        try:
+            return self.client.futures_get_order(
+                symbol=symbol, origClientOrderId=client_order_id
+            )
+        except Exception:
+            return None
+
     def account_info(self):
         """
         fetch user details if client configured successfully
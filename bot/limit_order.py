@@ -1,11 +1,10 @@
 """Limit Order Module for Binance Futures Trading Bot"""
 
-from bot.utils.logging_config import configure_logs, get_logger
+from bot.utils.logging_config import get_logger
 from bot.client import BinanceBot
 from bot.utils.validators import Validator
 
 
-configure_logs(verbose=True)
 logging = get_logger()
 
 class LimitOrder:
@@ -48,7 +47,7 @@ class LimitOrder:
 
         try:
             logging.info(f"Placing Limit Order | {side} | {quantity} | {symbol} | {price} |")
-            limit_order = self.client.futures_create_order(
+            limit_order = self.bot.create_order(
                 symbol=symbol,
                 side=side,
                 type="LIMIT",
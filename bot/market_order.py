@@ -1,10 +1,11 @@
 """Market Order file for Binance Trading Bot"""
+import functools
+
 from bot.client import BinanceBot
-from bot.utils.logging_config import configure_logs, get_logger
+from bot.utils.logging_config import get_logger
 from bot.utils.validators import Validator
 
 
-configure_logs(verbose=True)
 logging = get_logger()
 
 class MarketOrder:
@@ -17,6 +18,22 @@ class MarketOrder:
         """
         self.bot = bot
         self.client = bot.client
+        # Prebuilt submit callables keyed by (symbol, side); the static
+        # kwargs are bound once so the hot path only patches quantity.
+        self._fast_path_cache: dict = {}
+
+    def _order_sender(self, symbol: str, side: str):
+        """Return the cached submit callable for this (symbol, side) pair."""
+        send = self._fast_path_cache.get((symbol, side))
+        if send is None:
+            send = functools.partial(
+                self.bot.create_order,
+                symbol=symbol,
+                side=side,
+                type="MARKET",
+            )
+            self._fast_path_cache[(symbol, side)] = send
+        return send
 
     def place_order(
             self,
@@ -40,31 +57,27 @@ class MarketOrder:
         try:
             logging.info(f"Placing Order | {side} | {quantity} | {symbol} | lev {leverage}")
 
-            Validator.validate_symbol(symbol, self.client)
             Validator.validate_side(side)
             Validator.validate_order_params(symbol, quantity)
-            Validator.validate_market_status(self.client)
             Validator.validate_leverage(leverage)
-            Validator.validate_margin(self.client)
+
+            bundle = Validator.prefetch(self.client, symbol)
+            Validator.validate_symbol(symbol, self.client)
+            Validator.validate_margin(bundle)
 
             self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
 
             quantity = Validator.validate_quantity_bounds(
                 symbol=symbol,
                 quantity=quantity,
-                client=self.client,
+                bundle=bundle,
                 leverage=leverage
             )
 
             if not quantity or quantity <= 0:
                 logging.error("Order Aborted: Invalid quantity after validation")
                 return None
-            order = self.client.futures_create_order(
-                symbol= symbol,
-                quantity= quantity,
-                side = side,
-                type = "Market"
-            )
+            order = self._order_sender(symbol, side)(quantity=quantity)
             logging.info(f"Order Placed successfully with id: {order.get("orderId")}")
             return order
 
@@ -1,13 +1,39 @@
 """Global logger initialized here"""
+import atexit
+import logging
 import sys
 from loguru import logger
 
 LOG_FILE = "bot.log"
 
+_CONFIGURED = False
+
+
+class InterceptHandler(logging.Handler):
+    """Route stdlib logging records into the Loguru sinks."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        frame, depth = sys._getframe(6), 6
+        while frame and frame.f_code.co_filename == logging.__file__:
+            frame = frame.f_back
+            depth += 1
+
+        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
 
 def configure_logs(verbose: bool = False, pipe_to_stderr: bool = True):
     """Takeover process logs and create a logger with Loguru according to the
-    configuration."""
+    configuration. Safe to call more than once; only the first call wins."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+
     logger.remove()
 
     level = "DEBUG" if verbose else "INFO"
@@ -18,22 +44,33 @@ def configure_logs(verbose: bool = False, pipe_to_stderr: bool = True):
         level=level,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
                "<level>{level: <8}</level> | <level>{message}</level>",
-        colorize=True,
+        colorize=pipe.isatty(),
         backtrace=True,
-        diagnose=True,
+        diagnose=verbose,
+        enqueue=True,
     )
 
     logger.add(
         LOG_FILE,
         level=level,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
-        backtrace=True,
-        diagnose=True,
-        rotation=None,
-        retention=None,
+        backtrace=False,
+        diagnose=False,
+        rotation="50 MB",
+        retention=5,
         compression=None,
+        enqueue=True,
+        buffering=8192,
     )
 
+    # Stdlib logging records (e.g. from third-party libraries or cli.py)
+    # share the same sink tree instead of a second handler stack.
+    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+
+    # The sinks write from a background thread; drain the queue on exit so
+    # records logged just before shutdown (e.g. fatal errors) reach the file.
+    atexit.register(logger.complete)
+
 
 def get_logger():
     """Return the logger for all modules."""
@@ -2,16 +2,128 @@
 Validators for Binance trading bot with logging
 """
 
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
 from binance.client import Client
 from bot.utils.logging_config import get_logger
 
 logger = get_logger()
 
+# Exchange info is a large payload that changes rarely, so it is cached here
+# for a few minutes to keep validators off the network on the order hot path.
+_SIDES = frozenset({"BUY", "SELL"})
+_TIF = frozenset({"GTC", "IOC", "FOK"})
+
+_EXCHANGE_INFO_TTL = 300.0
+_EXCHANGE_INFO_CACHE: Optional[tuple] = None
+_EXCHANGE_INFO_LOCK = threading.Lock()
+
+
+def _get_exchange_info(client: Client) -> tuple:
+    """
+    Return (symbols_set, by_symbol) built from futures_exchange_info.
+
+    The payload is fetched at most once per TTL window; lookups afterwards
+    are O(1) with zero I/O. Refresh is lock-protected for threaded use.
+    """
+    global _EXCHANGE_INFO_CACHE
+    cached = _EXCHANGE_INFO_CACHE
+    if cached is not None and time.monotonic() - cached[0] < _EXCHANGE_INFO_TTL:
+        return cached[1], cached[2]
+    with _EXCHANGE_INFO_LOCK:
+        cached = _EXCHANGE_INFO_CACHE
+        if cached is not None and time.monotonic() - cached[0] < _EXCHANGE_INFO_TTL:
+            return cached[1], cached[2]
+        info = client.futures_exchange_info()
+        symbols_set = frozenset(item['symbol'] for item in info['symbols'])
+        by_symbol = {}
+        for item in info['symbols']:
+            # Key the filter list by filterType once, so lookups like
+            # PRICE_FILTER/LOT_SIZE need no positional indexing or scans.
+            item['filters_by_type'] = {f['filterType']: f for f in item.get('filters', [])}
+            by_symbol[item['symbol']] = item
+        _EXCHANGE_INFO_CACHE = (time.monotonic(), symbols_set, by_symbol)
+        return symbols_set, by_symbol
+
+
+def _fetch_usdt_balance(client: Client) -> float:
+    """
+    Fetch the account balance once and return the parsed USDT amount.
+
+    This is the only place the balance endpoint is hit on the order path;
+    callers share the value through the PrecheckBundle.
+    """
+    balances = {b["asset"]: b["balance"] for b in client.futures_account_balance()}
+    return float(balances.get("USDT", 0.0))
+
+@dataclass
+class PrecheckBundle:
+    """
+    Snapshot of the per-order REST data fetched once by Validator.prefetch
+    so the individual validators run without any I/O of their own
+    """
+    symbols_set: frozenset
+    symbol_filters: Optional[dict]
+    price: float
+    usdt_balance: float
+
+
 class Validator:
     """
     All the validators are defined under this validator class
     """
+    @staticmethod
+    def prefetch(client: Client, symbol: str) -> PrecheckBundle:
+        """
+        Fetch everything the per-order prechecks need in parallel.
+
+        Exchange info, ticker price, account balance and the ping all run
+        concurrently, so the prechecks cost roughly one round-trip instead
+        of one blocking call per validator.
+
+        :param client: Binance client
+        :param symbol: Trading pair
+        """
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            info_future = pool.submit(_get_exchange_info, client)
+            ticker_future = pool.submit(client.futures_symbol_ticker, symbol=symbol)
+            balance_future = pool.submit(_fetch_usdt_balance, client)
+            ping_future = pool.submit(client.futures_ping)
+
+            if ping_future.result() is None:
+                logger.error("Binance Futures API is unreachable")
+                raise ConnectionError("Binance Futures API is unreachable")
+            symbols_set, by_symbol = info_future.result()
+            price = float(ticker_future.result()["price"])
+            usdt_balance = balance_future.result()
+
+        logger.opt(lazy=True).debug(
+            "Precheck data fetched for {}: price={}, balance={}",
+            lambda: symbol, lambda: price, lambda: usdt_balance,
+        )
+        return PrecheckBundle(symbols_set, by_symbol.get(symbol), price, usdt_balance)
+
+    @staticmethod
+    def warm_exchange_info(client: Client) -> None:
+        """
+        Fetch and cache exchange info ahead of the first order.
+        """
+        _get_exchange_info(client)
+
+    @staticmethod
+    def symbol_filters(symbol: str, client: Client) -> Optional[dict]:
+        """
+        Return the cached filterType-keyed filters for a symbol, or None
+        if the symbol is unknown on Binance Futures.
+        """
+        _, by_symbol = _get_exchange_info(client)
+        symbol_info = by_symbol.get(symbol)
+        return symbol_info['filters_by_type'] if symbol_info else None
+
     @staticmethod
     def validate_api_keys(api_key: Optional[str], secret_key: Optional[str]) -> None:
         """
@@ -49,8 +161,9 @@ class Validator:
         if price is not None and price <= 0:
             logger.error("Price must be positive if provided")
             raise ValueError("Price must be positive if provided")
-        logger.debug(
-            f"Order parameters validated: symbol={symbol}, quantity={quantity}, price={price}"
+        logger.opt(lazy=True).debug(
+            "Order parameters validated: symbol={}, quantity={}, price={}",
+            lambda: symbol, lambda: quantity, lambda: price,
         )
 
     @staticmethod
@@ -59,8 +172,7 @@ class Validator:
         Checks if the given symbol exists on Binance futures.
         """
         try:
-            exchange_info = client.futures_exchange_info()
-            valid_symbols = [item['symbol'] for item in exchange_info['symbols']]
+            valid_symbols, _ = _get_exchange_info(client)
             if symbol not in valid_symbols:
                 logger.error(f"Symbol '{symbol}' is not available on Binance Futures")
                 raise ValueError(f"Symbol '{symbol}' is not available on Binance Futures")
@@ -71,8 +183,8 @@ class Validator:
 
     @staticmethod
     def validate_side(side: str) -> None:
-        """Ensure order side is BUY or SELL"""
-        if side.upper() not in ["BUY", "SELL"]:
+        """Ensure order side is BUY or SELL; callers pass it uppercased"""
+        if side not in _SIDES:
             logger.error("Side must be BUY or SELL")
             raise ValueError("Side must be BUY or SELL")
         logger.debug(f"Side validated: {side}")
@@ -94,33 +206,32 @@ class Validator:
             logger.error("Price must be greater than zero")
             raise ValueError("Price must be greater than zero")
 
-        try:
-            exchange_info = client.futures_exchange_info()
-            symbol_info = next(
-                item for item in exchange_info['symbols'] if item['symbol'] == symbol
-            )
-            min_price = float(symbol_info['filters'][0]['minPrice'])
-            if price < min_price:
-                logger.error(f"Price {price} is less than min price {min_price} for {symbol}")
-            logger.debug(
-                f"Quantity and price validated: quantity={quantity}, price={price} (min {min_price})"
-            )
-        except StopIteration:
+        _, by_symbol = _get_exchange_info(client)
+        symbol_info = by_symbol.get(symbol)
+        if symbol_info is None:
             logger.error(f"Symbol info not found for {symbol}")
+            return
+        min_price = float(symbol_info['filters_by_type'].get('PRICE_FILTER', {}).get('minPrice', 0))
+        if price < min_price:
+            logger.error(f"Price {price} is less than min price {min_price} for {symbol}")
+        logger.opt(lazy=True).debug(
+            "Quantity and price validated: quantity={}, price={} (min {})",
+            lambda: quantity, lambda: price, lambda: min_price,
+        )
 
     @staticmethod
     def validate_time_in_force(tif: str) -> None:
-        """Ensure timeInForce is valid"""
-        valid_tif = ["GTC", "IOC", "FOK"]
-        if tif.upper() not in valid_tif:
-            logger.error(f"Invalid timeInForce '{tif}'. Must be one of {valid_tif}")
+        """Ensure timeInForce is valid; callers pass it uppercased"""
+        if tif not in _TIF:
+            logger.error(f"Invalid timeInForce '{tif}'. Must be one of {sorted(_TIF)}")
+            raise ValueError(f"Invalid timeInForce '{tif}'. Must be one of {sorted(_TIF)}")
         logger.debug(f"timeInForce validated: {tif}")
 
     @staticmethod
     def validate_min_notional(
         symbol: str,
         quantity: float,
-        client: Client,
+        bundle: PrecheckBundle,
         min_notional_usd: float = 100
         ) -> None:
         """
@@ -128,27 +239,24 @@ class Validator:
 
         :param symbol: Trading pair
         :param quantity: Amount of asset to buy/sell
-        :param client: Binance client
+        :param bundle: Prefetched precheck data
         :param min_notional_usd: Minimum USD value (default $100)
         """
-        try:
-            price = float(client.futures_symbol_ticker(symbol=symbol)["price"])
-            notional = quantity * price
-            if notional < min_notional_usd:
-                logger.error(
-                    f"Order value for {symbol} is too small: {notional:.2f} USD. Minimum is {min_notional_usd} USD"
-                )
-                raise ValueError(f"Minimum order value for {symbol} is {min_notional_usd} USD")
-            logger.debug(f"Notional value validated: {notional:.2f} USD for symbol {symbol}")
-        except Exception as e:
-            logger.error(f"Failed to fetch price for {symbol}: {e}", exc_info=True)
-            raise
+        notional = quantity * bundle.price
+        if notional < min_notional_usd:
+            logger.error(
+                f"Order value for {symbol} is too small: {notional:.2f} USD. Minimum is {min_notional_usd} USD"
+            )
+            raise ValueError(f"Minimum order value for {symbol} is {min_notional_usd} USD")
+        logger.opt(lazy=True).debug(
+            "Notional value validated: {:.2f} USD for symbol {}", lambda: notional, lambda: symbol
+        )
 
     @staticmethod
     def validate_quantity_bounds(
         symbol: str,
         quantity: float,
-        client: Client,
+        bundle: PrecheckBundle,
         leverage: int = 20,
         min_usd: float = 100
         ) -> float:
@@ -158,14 +266,20 @@ class Validator:
         - Available margin with given leverage
         Returns a safe quantity that can be placed.
         """
-        price = float(client.futures_symbol_ticker(symbol=symbol)["price"])
+        price = bundle.price
 
-        min_qty = round(min_usd / price, 6)
+        # Quantize bounds in whole stepSize units so adjusted quantities
+        # always pass the LOT_SIZE filter instead of being rejected.
+        lot_filter = (bundle.symbol_filters or {}).get('filters_by_type', {}).get('LOT_SIZE', {})
+        step_size = float(lot_filter.get('stepSize', 0))
 
-        bal = float(next(
-            b["balance"] for b in client.futures_account_balance() if b["asset"] == "USDT"
-        ))
-        max_qty = round((bal * leverage * 0.8) / price, 6)
+        if step_size > 0:
+            step_scale = round(1 / step_size)
+            min_qty = math.ceil(min_usd / price * step_scale) / step_scale
+            max_qty = math.floor(bundle.usdt_balance * leverage * 0.8 / price * step_scale) / step_scale
+        else:
+            min_qty = round(min_usd / price, 6)
+            max_qty = round((bundle.usdt_balance * leverage * 0.8) / price, 6)
         if quantity < min_qty:
             logger.warning(f"Quantity {quantity} too low, adjusted → {min_qty}")
             return min_qty
@@ -183,22 +297,20 @@ class Validator:
             raise ValueError("Leverage must be an integer")
         if leverage < 1 or leverage > 125:
             raise ValueError("Leverage must be between 1 and 125")
-        logger.debug(f"Leverage validated: {leverage}")
+        logger.opt(lazy=True).debug("Leverage validated: {}", lambda: leverage)
         return leverage
     
     @staticmethod
-    def validate_margin(client: Client, min_usd_required: float = 10) -> float:
+    def validate_margin(bundle: PrecheckBundle, min_usd_required: float = 10) -> float:
         """
         Ensure the account has minimum USDT balance to trade.
         """
-        bal = float(next(
-            b["balance"] for b in client.futures_account_balance() if b["asset"] == "USDT"
-        ))
+        bal = bundle.usdt_balance
         if bal < min_usd_required:
             raise ValueError(
                 f"Insufficient balance: {bal} USDT. Minimum required is {min_usd_required} USDT"
                 )
-        logger.debug(f"Available USDT balance validated: {bal}")
+        logger.opt(lazy=True).debug("Available USDT balance validated: {}", lambda: bal)
         return bal
 
     @staticmethod
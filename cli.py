@@ -5,8 +5,6 @@ Binance Futures Trading Bot CLI
 import argparse
 import logging
 import sys
-from datetime import datetime
-from pathlib import Path
 from typing import Dict
 
 from rich.console import Console
@@ -18,30 +16,14 @@ from rich.table import Table
 from rich.tree import Tree
 from rich import box
 
+from bot.utils.logging_config import configure_logs
 from bot.client import BinanceBot
 from bot.market_order import MarketOrder
 from bot.limit_order import LimitOrder
 from bot.advanced.oco import OCOOrder
 
 console = Console()
-LOG_PATH = Path("logs")
-
-
-def configure_logging(verbose: bool = False) -> None:
-    """
-    Docstring for configure_logging
-    
-    :param verbose: Description
-    :type verbose: bool
-    """
-    LOG_PATH.mkdir(exist_ok=True)
-    log_file = LOG_PATH / f"bot_{datetime.now():%Y%m%d}.log"
-
-    logging.basicConfig(
-        level=logging.DEBUG if verbose else logging.INFO,
-        format="%(asctime)s | %(levelname)-7s | %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)],
-    )
+_MENU_CHOICES = ("0", "1", "2", "3", "4")
 
 
 def banner() -> None:
@@ -56,21 +38,28 @@ def banner() -> None:
     console.print(Align.center(panel))
 
 
+_TABLE_STYLE = {
+    "box": box.ROUNDED,
+    "header_style": "bold cyan",
+    "border_style": "blue",
+}
+
+
+def _make_table_template(title: str) -> Table:
+    """Return a result table preconfigured with the shared style and columns"""
+    table = Table(title=title, **_TABLE_STYLE)
+    table.add_column("Field", justify="left")
+    table.add_column("Value", justify="left")
+    return table
+
+
 def result_table(title: str, data: Dict) -> None:
     """Create a table"""
     if not data:
         console.print("No response received. Check logs.")
         return
 
-    table = Table(
-        title=title,
-        box=box.ROUNDED,
-        header_style="bold cyan",
-        border_style="blue",
-    )
-
-    table.add_column("Field", justify="left")
-    table.add_column("Value", justify="left")
+    table = _make_table_template(title)
     for key, value in data.items():
         table.add_row(key, str(value))
 
@@ -150,17 +139,20 @@ def interactive_menu(bot: BinanceBot) -> None:
     """
     A menu is defined here
     """
+    # The menu is static; build the tree and panel once instead of
+    # reallocating them on every loop iteration.
+    tree = Tree("Main Menu")
+    trading = tree.add("Trading")
+    trading.add("1. Market Order")
+    trading.add("2. Limit Order")
+    trading.add("3. OCO Order")
+    tree.add("4. Check Connection")
+    tree.add("0. Exit")
+    menu_panel = Panel(tree, border_style="cyan")
+
     while True:
-        tree = Tree("Main Menu")
-        trading = tree.add("Trading")
-        trading.add("1. Market Order")
-        trading.add("2. Limit Order")
-        trading.add("3. OCO Order")
-        tree.add("4. Check Connection")
-        tree.add("0. Exit")
-
-        console.print(Panel(tree, border_style="cyan"))
-        choice = Prompt.ask("Select option", choices=["0", "1", "2", "3", "4"])
+        console.print(menu_panel)
+        choice = Prompt.ask("Select option", choices=list(_MENU_CHOICES))
         console.print()
 
         if choice == "1":
@@ -236,7 +228,7 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    configure_logging(verbose=args.verbose)
+    configure_logs(verbose=args.verbose)
     banner()
 
     bot = BinanceBot(testnet=args.testnet)